@@ -1,9 +1,16 @@
-import sys, time, random, argparse, csv, re
+import sys, time, random, argparse, csv, re, queue, threading
+from dataclasses import dataclass, fields
+from operator import attrgetter
 from typing import List, Dict, Optional, Tuple
-from urllib.parse import urljoin, urldefrag
 
 from playwright.sync_api import sync_playwright, TimeoutError as PWTimeout
 
+# Optional RE2 (DFA, no backtracking) for the per-card text scan
+try:
+    import re2 as _scan_re
+except Exception:
+    _scan_re = re
+
 # Pretty console (colors)
 try:
     from rich.console import Console
@@ -31,6 +38,12 @@ NEXT_PAGE_CANDIDATES = [
     ".pagination .next a, .pagination-next a, a.pagination-next",
 ]
 
+# Output file buffer; rows are written and flushed once per page
+OUT_BUFFER_SIZE = 1 << 20
+
+# Not needed for extraction; aborted at the network layer
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+
 # IDS-style TSV headers (exact strings)
 TSV_HEADERS = [
     "pic href", "pic src", "trunc-title",
@@ -49,12 +62,73 @@ CSV_FIELDS = [
     "status", "extra_info",
 ]
 
-BIDS_RE = re.compile(r"\(bids:\s*([0-9]+)\)", re.I)
+@dataclass(slots=True)
+class IdsRecord:
+    """One card in IDS-style columns (same order as TSV_HEADERS)."""
+    pic_href: Optional[str] = None
+    pic_src: Optional[str] = None
+    trunc_title: Optional[str] = None
+    float_left: Optional[str] = None
+    float_right: Optional[str] = None
+    float_left_2: Optional[str] = None
+    float_right_2: Optional[str] = None
+    float_right_3: Optional[str] = None
+    float_left_4: Optional[str] = None
+    item_extra_info: Optional[str] = None
+    float_right_5: Optional[str] = None
+    red_small: Optional[str] = None
+    float_left_5: Optional[str] = None
+    float_left_6: Optional[str] = None
+    float_right_6: Optional[str] = None
+    float_left_7: Optional[str] = None
+
+@dataclass(slots=True)
+class NormRecord:
+    """One card in normalized, human-readable fields (same order as CSV_FIELDS)."""
+    item_url: Optional[str] = None
+    image_url: Optional[str] = None
+    title: Optional[str] = None
+    current_bid: Optional[str] = None
+    min_bid: Optional[str] = None
+    bid_increment: Optional[str] = None
+    high_bidder: Optional[str] = None
+    bids: Optional[str] = None
+    time_remaining: Optional[str] = None
+    item_location: Optional[str] = None
+    status: Optional[str] = None
+    extra_info: Optional[str] = None
+
+# Records -> row tuples in one C-level call
+ids_row = attrgetter(*[f.name for f in fields(IdsRecord)])
+norm_row = attrgetter(*[f.name for f in fields(NormRecord)])
+# Both getters emit fields in declaration order; check it matches the headers
+if [f.name for f in fields(IdsRecord)] != [h.replace(" ", "_").replace("-", "_") for h in TSV_HEADERS]:
+    raise RuntimeError("IdsRecord fields are out of sync with TSV_HEADERS")
+if [f.name for f in fields(NormRecord)] != CSV_FIELDS:
+    raise RuntimeError("NormRecord fields are out of sync with CSV_FIELDS")
+
 DOLLAR_RE = re.compile(r"\$\s?[\d,]+(?:\.\d{2})?")
+# Status markers, bid count and dollar amounts in one left-to-right pass.
+# Case-insensitive so the card text never has to be upper-cased first.
+CARD_SCAN_RE = _scan_re.compile(
+    r"(?i:(?P<status>WITHDRAWN|CLOSED))"
+    r"|(?i:\(bids:\s*(?P<bids>[0-9]+)\))"
+    r"|(?P<dollar>" + DOLLAR_RE.pattern + r")"
+)
+_WS_RE = re.compile(r"\s+")
+
+# Bound methods for the per-card hot path in normalize_record()
+_card_scan = CARD_SCAN_RE.finditer
+_ws_sub = _WS_RE.sub
 
 def norm_space(s: Optional[str]) -> Optional[str]:
-    if s is None: return None
-    return " ".join(s.split())
+    if not s:
+        return s
+    # isprintable() is False for tabs, newlines and non-ASCII spaces, so this
+    # fast path only sees text whose whitespace is already single spaces
+    if "  " not in s and s.isprintable():
+        return s.strip()
+    return _ws_sub(" ", s).strip()
 
 def sanitize_tsv_field(v: Optional[str]) -> str:
     # Keep TSV clean but readable
@@ -65,236 +139,262 @@ def try_click_any(page, selectors: List[str]) -> bool:
     for sel in selectors:
         try:
             el = page.locator(sel).first
-            if el.count() > 0 and el.is_visible():
+            # is_visible() is False for a missing element, no count() round-trip needed
+            if el.is_visible():
                 el.click()
                 return True
         except Exception:
             continue
     return False
 
+# Scroll-to-stall runs entirely in the page: one evaluate() instead of a
+# scroll + sleep + count() round-trip per iteration. Each pause starts on the
+# next animation frame so it tracks actual rendering.
+AUTOSCROLL_JS = """
+async ([sel, pauseMs, maxRoundsNoNew, maxScrolls]) => {
+  const count = () => document.querySelectorAll(sel).length;
+  let last = count(), rounds = 0, total = 0;
+  while (rounds < maxRoundsNoNew && total <= maxScrolls) {
+    window.scrollTo(0, document.body.scrollHeight);
+    await new Promise(r => requestAnimationFrame(() => setTimeout(r, pauseMs)));
+    total++;
+    const n = count();
+    if (n <= last) rounds++;
+    else { rounds = 0; last = n; }
+  }
+  return [last, total];
+}
+"""
+
 def autoscroll_until_stall(page, scroll_pause: float, max_rounds_no_new: int) -> Tuple[int, int]:
     """Scroll down until the number of item anchors stops growing for a few rounds."""
-    rounds_without_growth = 0
-    last_cnt = page.locator(ITEM_ANCHOR_SELECTOR).count()
-    total_scrolls = 0
-    while rounds_without_growth < max_rounds_no_new:
-        try:
-            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-        except Exception:
-            break
-        page.wait_for_timeout(int(scroll_pause * 1000))
-        total_scrolls += 1
-        new_cnt = page.locator(ITEM_ANCHOR_SELECTOR).count()
-        if new_cnt <= last_cnt:
-            rounds_without_growth += 1
-        else:
-            rounds_without_growth = 0
-            last_cnt = new_cnt
-        if total_scrolls > 200:
-            break
-    return last_cnt, total_scrolls
-
-def txt(el) -> Optional[str]:
-    try:
-        t = el.inner_text().strip()
-        return t if t else None
-    except Exception:
-        return None
-
-def attr(el, name: str) -> Optional[str]:
-    try:
-        v = el.get_attribute(name)
-        return v.strip() if v else None
-    except Exception:
-        return None
-
-def nearest_card_root(a_loc):
-    # Try to find a container block ("card") for the anchor
-    candidates_xpath = (
-        "xpath=ancestor::*["
-        "contains(@class,'card') or contains(@class,'item') or contains(@class,'list') "
-        "or contains(@class,'row') or contains(@class,'column') or contains(@class,'listview')"
-        "][1]"
-    )
-    try:
-        loc = a_loc.locator(candidates_xpath)
-        return loc if loc.count() > 0 else a_loc
-    except Exception:
-        return a_loc
-
-def extract_ids_style_record(page, a_loc) -> Dict[str, Optional[str]]:
-    """Return a dict with IDS-style keys."""
-    href = attr(a_loc, "href")
-    if href:
-        href = urljoin(ALLITEMS_URL, href)
-        href, _ = urldefrag(href)
-
-    img_src = None
-    try:
-        img = a_loc.locator("img").first
-        if img.count() > 0:
-            img_src = attr(img, "src") or attr(img, "data-src")
-            if img_src:
-                img_src = urljoin(ALLITEMS_URL, img_src)
-    except Exception:
-        pass
-
-    root = nearest_card_root(a_loc)
-
-    # title
-    trunc_title = None
-    try:
-        tloc = root.locator(".trunc-title").first
-        trunc_title = txt(tloc) if tloc.count() > 0 else txt(a_loc)
-    except Exception:
-        trunc_title = txt(a_loc)
-
-    # collect float-left / float-right buckets in order
-    lefts, rights = [], []
     try:
-        lc = root.locator(".float-left").count()
-        for i in range(lc):
-            lefts.append(txt(root.locator(".float-left").nth(i)))
-    except Exception:
-        pass
-    try:
-        rc = root.locator(".float-right").count()
-        for i in range(rc):
-            rights.append(txt(root.locator(".float-right").nth(i)))
-    except Exception:
-        pass
-
-    # extra info
-    item_extra_info = None
-    try:
-        ie = root.locator(".item_extra_info").first
-        if ie.count() > 0:
-            item_extra_info = txt(ie)
+        last_cnt, total_scrolls = page.evaluate(
+            AUTOSCROLL_JS, [ITEM_ANCHOR_SELECTOR, int(scroll_pause * 1000), max_rounds_no_new, 200]
+        )
     except Exception:
-        pass
+        # Scrolling failed: report the anchors present rather than zero, so
+        # callers comparing before/after don't mistake this for a stall
+        return page.locator(ITEM_ANCHOR_SELECTOR).count(), 0
+    return last_cnt, total_scrolls
 
-    red_small = None
+# Extract every card on the page in a single in-browser pass. Each locator
+# call is a CDP round-trip, so walking anchors one by one from Python costs
+# ~20 round-trips per card; this returns plain JSON for all of them at once.
+EXTRACT_ALL_JS = """
+(sel) => {
+  const pickText = (el) => {
+    const t = el && el.innerText ? el.innerText.trim() : "";
+    return t || null;
+  };
+  const pickAttr = (el, name) => {
+    const v = el && el.getAttribute(name);
+    return (v && v.trim()) || null;
+  };
+  // Resolve against the page (and drop any #fragment) here rather than
+  // running urljoin/urldefrag over every card in Python
+  const absUrl = (v) => {
+    if (!v) return null;
+    try { return new URL(v, document.baseURI).href.split("#")[0]; } catch (e) { return null; }
+  };
+  const cardSel = "[class*='card'],[class*='item'],[class*='list'],[class*='row'],[class*='column']";
+  return Array.from(document.querySelectorAll(sel)).map(a => {
+    const root = (a.parentElement && a.parentElement.closest(cardSel)) || a;
+    const img = a.querySelector("img");
+    return {
+      href: absUrl(pickAttr(a, "href")),
+      img: absUrl(pickAttr(img, "src") || pickAttr(img, "data-src")),
+      title: pickText(root.querySelector(".trunc-title")) || pickText(a),
+      lefts: Array.from(root.querySelectorAll(".float-left"), pickText),
+      rights: Array.from(root.querySelectorAll(".float-right"), pickText),
+      extra: pickText(root.querySelector(".item_extra_info")),
+      red: pickText(root.querySelector(".red_small")),
+      cardText: pickText(root),
+    };
+  });
+}
+"""
+
+def extract_all_cards(page) -> List[Dict]:
+    """Return raw card dicts for every item anchor currently in the DOM."""
+    return page.evaluate(EXTRACT_ALL_JS, ITEM_ANCHOR_SELECTOR) or []
+
+_PAD: List[Optional[str]] = [None] * 7
+
+def extract_ids_style_record(card: Dict) -> Tuple[IdsRecord, List[Optional[str]], List[Optional[str]], str]:
+    """Return an IDS-style record built from one raw card dict."""
+    lefts = card.get("lefts") or []
+    rights = card.get("rights") or []
+    card_text = card.get("cardText") or " ".join(filter(None, lefts + rights))
+
+    # Pad once so the columns below are plain indexing (IDS uses slots 0..6)
+    L = lefts + _PAD
+    R = rights + _PAD
+
+    return IdsRecord(
+        pic_href=card.get("href"),
+        pic_src=card.get("img"),
+        trunc_title=card.get("title"),
+        float_left=L[0],
+        float_right=R[0],
+        float_left_2=L[1],
+        float_right_2=R[1],
+        float_right_3=R[2],
+        float_left_4=L[3],
+        item_extra_info=card.get("extra"),
+        float_right_5=R[4],
+        red_small=card.get("red"),
+        float_left_5=L[4],
+        float_left_6=L[5],
+        float_right_6=R[5],
+        float_left_7=L[6],
+    ), lefts, rights, card_text
+
+# float-left label substring -> NormRecord field, first match wins
+LABEL_FIELDS = (
+    ("current bid", "current_bid"),
+    ("min bid", "min_bid"),
+    ("high bidder", "high_bidder"),
+    ("time remaining", "time_remaining"),
+    ("item location", "item_location"),
+)
+
+# The site only uses a handful of distinct labels, so each raw label is
+# resolved once and every later card is a single dict lookup.
+_label_field_cache: Dict[str, Optional[str]] = {}
+
+def label_field(label: str) -> Optional[str]:
+    """Return the NormRecord field a float-left label maps to, if any."""
     try:
-        rs = root.locator(".red_small").first
-        if rs.count() > 0:
-            red_small = txt(rs)
-    except Exception:
+        return _label_field_cache[label]
+    except KeyError:
         pass
+    low = label.strip().rstrip(":").lower()
+    field = next((f for key, f in LABEL_FIELDS if key in low), None)
+    if len(_label_field_cache) < 1024:
+        _label_field_cache[label] = field
+    return field
 
-    def pick(arr, idx):
-        try:
-            return arr[idx] if idx < len(arr) else None
-        except Exception:
-            return None
-
-    return {
-        "pic href": href,
-        "pic src": img_src,
-        "trunc-title": trunc_title,
-        "float-left": pick(lefts, 0),
-        "float-right": pick(rights, 0),
-        "float-left 2": pick(lefts, 1),
-        "float-right 2": pick(rights, 1),
-        "float-right 3": pick(rights, 2),
-        "float-left 4": pick(lefts, 3),
-        "item_extra_info": item_extra_info,
-        "float-right 5": pick(rights, 4),
-        "red_small": red_small,
-        "float-left 5": pick(lefts, 4),
-        "float-left 6": pick(lefts, 5),
-        "float-right 6": pick(rights, 5),
-        "float-left 7": pick(lefts, 6),
-    }, lefts, rights, root
-
-def normalize_record(ids_rec: Dict[str, Optional[str]], lefts: List[Optional[str]], rights: List[Optional[str]], root) -> Dict[str, Optional[str]]:
+def normalize_record(ids_rec: IdsRecord, lefts: List[Optional[str]], rights: List[Optional[str]], card_text: str) -> NormRecord:
     """
     Best-effort mapping of label/value pairs into readable fields.
     We scan float-left/right pairs, plus card text, to infer common fields.
     """
     # Base fields
-    norm: Dict[str, Optional[str]] = {
-        "item_url": ids_rec.get("pic href"),
-        "image_url": ids_rec.get("pic src"),
-        "title": ids_rec.get("trunc-title"),
-        "current_bid": None,
-        "min_bid": None,
-        "bid_increment": None,
-        "high_bidder": None,
-        "bids": None,
-        "time_remaining": None,
-        "item_location": None,
-        "status": None,
-        "extra_info": ids_rec.get("item_extra_info") or ids_rec.get("red_small"),
-    }
-
-    # Build label->value mapping from left/right lists
-    pairs: List[Tuple[str, Optional[str]]] = []
+    norm = NormRecord(
+        item_url=ids_rec.pic_href,
+        image_url=ids_rec.pic_src,
+        title=ids_rec.trunc_title,
+        extra_info=ids_rec.item_extra_info or ids_rec.red_small,
+    )
+
+    # Map known float-left labels onto their float-right values
+    n_rights = len(rights)
     for i, lbl in enumerate(lefts):
-        if not lbl: 
+        if not lbl:
             continue
-        val = rights[i] if i < len(rights) else None
-        pairs.append((lbl.strip().rstrip(':'), norm_space(val)))
-
-    # Scan pairs for known labels
-    for label, value in pairs:
-        low = label.lower()
-        if "current bid" in low:
-            norm["current_bid"] = value
-        elif "min bid" in low:
-            norm["min_bid"] = value
-        elif "high bidder" in low:
-            norm["high_bidder"] = value
-        elif "time remaining" in low:
-            norm["time_remaining"] = value
-        elif "item location" in low:
-            norm["item_location"] = value
-
-    # Try to derive "bids" from the whole card text
-    try:
-        card_text = root.inner_text().strip()
-    except Exception:
-        card_text = " ".join(filter(None, lefts + rights))
-    m = BIDS_RE.search(card_text or "")
-    if m:
-        norm["bids"] = m.group(1)
+        field = label_field(lbl)
+        if field:
+            setattr(norm, field, norm_space(rights[i]) if i < n_rights else None)
 
-    # Status detection (very common on this site)
+    # Status detection (very common on this site), "bids" and stray dollar
+    # amounts all come from a single scan over the card text
     text_all = " ".join([
-        str(norm.get("extra_info") or ""),
-        str(ids_rec.get("red_small") or ""),
+        norm.extra_info or "",
+        ids_rec.red_small or "",
         card_text or "",
-        ids_rec.get("trunc-title") or "",
-    ]).upper()
-    if "WITHDRAWN" in text_all:
-        norm["status"] = "WITHDRAWN"
-    elif "CLOSED" in text_all:
-        norm["status"] = "CLOSED"
+        ids_rec.trunc_title or "",
+    ])
+    norm.status, norm.bids, dollars = scan_card_text(text_all)
 
     # Try to guess bid increment if we have multiple dollar amounts w/o labels
     # e.g., we already got current/min; look for a third $ that isn't assigned.
-    dollars = DOLLAR_RE.findall(text_all)
     if dollars:
         # unique while preserving order
         uniq = []
         for d in dollars:
             if d not in uniq:
                 uniq.append(d)
-        known = {norm.get("current_bid"), norm.get("min_bid")}
+        known = {norm.current_bid, norm.min_bid}
         unknown = [d for d in uniq if d not in known and d]
         if unknown:
-            norm["bid_increment"] = unknown[0]
+            norm.bid_increment = unknown[0]
 
     # If location text itself is a status marker, reflect it
-    if norm.get("item_location"):
-        loc_up = norm["item_location"].upper()
+    if norm.item_location:
+        loc_up = norm.item_location.upper()
         if "WITHDRAWN" in loc_up:
-            norm["status"] = "WITHDRAWN"
+            norm.status = "WITHDRAWN"
+
+    return NormRecord(*map(norm_space, norm_row(norm)))
+
+def scan_card_text(text: str) -> Tuple[Optional[str], Optional[str], List[str]]:
+    """Return (status, bids, dollar amounts) found in card text."""
+    status = bids = None
+    dollars = []
+    for m in _card_scan(text):
+        d = m.group("dollar")
+        if d:
+            dollars.append(d)
+            continue
+        b = m.group("bids")
+        if b:
+            if bids is None:
+                bids = b
+            continue
+        # WITHDRAWN wins over CLOSED wherever it appears in the text
+        if status != "WITHDRAWN":
+            status = m.group("status").upper()
+    return status, bids, dollars
+
+def tsv_line(rec: IdsRecord) -> str:
+    return "\t".join(map(sanitize_tsv_field, ids_row(rec))) + "\n"
 
-    return {k: (norm_space(v) if isinstance(v, str) else v) for k, v in norm.items()}
+class PageWriter:
+    """Write each page's TSV/CSV rows on a background thread.
 
-def write_tsv_row(out, rec: Dict[str, Optional[str]]):
-    row = [sanitize_tsv_field(rec.get(h)) for h in TSV_HEADERS]
-    out.write("\t".join(row) + "\n")
+    Disk (or pipe) I/O then overlaps with loading the next page instead of
+    blocking the Playwright thread. Use as a context manager; leaving the
+    block drains everything queued and re-raises any write error.
+    """
+    def __init__(self, tsv_out, csv_out=None, csv_writer=None, maxsize: int = 64):
+        self.tsv_out = tsv_out
+        self.csv_out = csv_out
+        self.csv_writer = csv_writer
+        self.error: Optional[BaseException] = None
+        self._q: "queue.Queue" = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(target=self._run, name="page-writer", daemon=True)
+
+    def __enter__(self) -> "PageWriter":
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._q.put(None)
+        self._thread.join()
+        if self.error is not None and exc is None:
+            raise self.error
+
+    def put(self, tsv_rows: List[str], csv_rows: List[Tuple[Optional[str], ...]]) -> None:
+        if self.error is not None:
+            raise self.error
+        self._q.put((tsv_rows, csv_rows))
+
+    def _run(self) -> None:
+        while True:
+            batch = self._q.get()
+            if batch is None:
+                return
+            if self.error is not None:
+                continue
+            tsv_rows, csv_rows = batch
+            try:
+                if tsv_rows:
+                    self.tsv_out.write("".join(tsv_rows)); self.tsv_out.flush()
+                if csv_rows:
+                    self.csv_writer.writerows(csv_rows); self.csv_out.flush()
+            except BaseException as e:
+                self.error = e
 
 def shorten(s: Optional[str], n: int = 96) -> str:
     if not s: return ""
@@ -305,9 +405,9 @@ def run_scrape(start_page: int, end_page: int, headless: bool, out_tsv: Optional
     if end_page < start_page:
         raise SystemExit("--end cannot be smaller than --start")
 
-    # Outputs
-    tsv_out = sys.stdout if not out_tsv else open(out_tsv, "w", encoding="utf-8", newline="")
-    csv_out = open(out_csv, "w", encoding="utf-8", newline="") if out_csv else None
+    # Outputs (rows are written once per page, so give the files a large buffer)
+    tsv_out = sys.stdout if not out_tsv else open(out_tsv, "w", encoding="utf-8", newline="", buffering=OUT_BUFFER_SIZE)
+    csv_out = open(out_csv, "w", encoding="utf-8", newline="", buffering=OUT_BUFFER_SIZE) if out_csv else None
     must_close = []
     if out_tsv: must_close.append(tsv_out)
     if csv_out: must_close.append(csv_out)
@@ -318,8 +418,8 @@ def run_scrape(start_page: int, end_page: int, headless: bool, out_tsv: Optional
     # Prepare normalized CSV writer
     csv_writer = None
     if csv_out:
-        csv_writer = csv.DictWriter(csv_out, fieldnames=CSV_FIELDS)
-        csv_writer.writeheader(); csv_out.flush()
+        csv_writer = csv.writer(csv_out)
+        csv_writer.writerow(CSV_FIELDS); csv_out.flush()
 
     # Pretty console on stderr
     console = Console(stderr=True) if (progress and colors and RICH_AVAILABLE) else None
@@ -328,7 +428,7 @@ def run_scrape(start_page: int, end_page: int, headless: bool, out_tsv: Optional
     ua = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
           "(KHTML, like Gecko) Chrome/124 Safari/537.36")
 
-    with sync_playwright() as p:
+    with sync_playwright() as p, PageWriter(tsv_out, csv_out, csv_writer) as writer:
         browser = p.chromium.launch(headless=headless)
         context = browser.new_context(
             user_agent=ua,
@@ -337,6 +437,13 @@ def run_scrape(start_page: int, end_page: int, headless: bool, out_tsv: Optional
             timezone_id="America/Chicago",
             locale="en-US",
         )
+        # Only attributes are read from <img>, so the heavy bytes can be dropped
+        def _route(route):
+            if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+                route.abort()
+            else:
+                route.continue_()
+        context.route("**/*", _route)
         page = context.new_page()
 
         page.goto(ALLITEMS_URL, wait_until="domcontentloaded", timeout=45_000)
@@ -380,38 +487,33 @@ def run_scrape(start_page: int, end_page: int, headless: bool, out_tsv: Optional
 
         def collect(page_idx: int):
             nonlocal item_idx
-            anchors = page.locator(ITEM_ANCHOR_SELECTOR)
-            n = anchors.count()
-            for i in range(n):
-                a = anchors.nth(i)
-                href = attr(a, "href")
-                if not href:
-                    continue
-                href = urljoin(ALLITEMS_URL, href)
-                href, _ = urldefrag(href)
-                if href in seen_hrefs:
+            tsv_rows: List[str] = []
+            csv_rows: List[Tuple[Optional[str], ...]] = []
+            for card in extract_all_cards(page):
+                ids_rec, lefts, rights, card_text = extract_ids_style_record(card)
+                href = ids_rec.pic_href
+                if not href or href in seen_hrefs:
                     continue
                 seen_hrefs.add(href)
 
-                ids_rec, lefts, rights, root = extract_ids_style_record(page, a)
-                # Write IDS TSV
-                write_tsv_row(tsv_out, ids_rec)
-                # Normalize and (optionally) write CSV
-                norm = normalize_record(ids_rec, lefts, rights, root)
+                # Queue IDS TSV row
+                tsv_rows.append(tsv_line(ids_rec))
+                # Normalize and (optionally) queue CSV row
+                norm = normalize_record(ids_rec, lefts, rights, card_text)
                 if csv_writer:
-                    csv_writer.writerow(norm)
+                    csv_rows.append(norm_row(norm))
 
                 # Live log
                 log_line(
                     item_idx, page_idx,
-                    norm.get("title") or ids_rec.get("pic href") or "",
-                    norm.get("status"),
-                    norm.get("current_bid"),
-                    norm.get("min_bid"),
+                    norm.title or ids_rec.pic_href or "",
+                    norm.status,
+                    norm.current_bid,
+                    norm.min_bid,
                 )
                 item_idx += 1
-            tsv_out.flush()
-            if csv_out: csv_out.flush()
+            # One write + flush per page, done off this thread
+            writer.put(tsv_rows, csv_rows)
 
         # Page 1
         if progress:
@@ -448,8 +550,7 @@ def run_scrape(start_page: int, end_page: int, headless: bool, out_tsv: Optional
 
             if not progressed:
                 before = page.locator(ITEM_ANCHOR_SELECTOR).count()
-                autoscroll_until_stall(page, 0.8, 2)
-                after = page.locator(ITEM_ANCHOR_SELECTOR).count()
+                after, _ = autoscroll_until_stall(page, 0.8, 2)
                 if after > before:
                     current_page += 1
                     if progress:
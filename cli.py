@@ -3,9 +3,11 @@ import sys
 import csv
 import argparse
 import asyncio
+from functools import lru_cache
+from operator import itemgetter
 from typing import Optional
 
-from scraper_engine import AllItemsScraper
+from scraper_engine import AllItemsScraper, IDS_FIELDS, NORM_FIELDS
 
 # Colors
 try:
@@ -17,25 +19,28 @@ except Exception:
     Console = None
     Text = None
 
-TSV_HEADERS = [
-    "pic href", "pic src", "trunc-title",
-    "float-left", "float-right",
-    "float-left 2", "float-right 2", "float-right 3", "float-left 4",
-    "item_extra_info", "float-right 5", "red_small",
-    "float-left 5", "float-left 6", "float-right 6", "float-left 7"
-]
-
-CSV_FIELDS = [
-    "item_url", "image_url", "title",
-    "current_bid", "min_bid", "bid_increment",
-    "high_bidder", "bids",
-    "time_remaining", "item_location",
-    "status", "extra_info",
-]
+TSV_HEADERS = list(IDS_FIELDS)
+# Pulls a record's values in header order in one call, whatever its key order
+_tsv_values = itemgetter(*TSV_HEADERS)
 
+CSV_FIELDS = list(NORM_FIELDS)
+_csv_values = itemgetter(*CSV_FIELDS)
+
+# Pre-built ANSI styles for the default progress line (rich is opt-in: its
+# render pipeline is far heavier than writing a few bytes per item)
+_ANSI = {"WITHDRAWN": b"\x1b[1;31m", "CLOSED": b"\x1b[33m", "": b"\x1b[1;37m"}
+_DIM = b"\x1b[2m"
+_RESET = b"\x1b[0m"
+
+# Rows are buffered and written in batches of this many (per sink)
+FLUSH_EVERY = 128
+
+_TSV_TRANS = str.maketrans({"\t": " ", "\r": " ", "\n": " "})
+
+# Cells repeat a lot across items (statuses, locations, bid labels)
+@lru_cache(maxsize=4096)
 def _sanitize_tsv(v: Optional[str]) -> str:
-    if v is None: return ""
-    return v.replace("\t"," ").replace("\r"," ").replace("\n"," ").strip()
+    return "" if v is None else v.translate(_TSV_TRANS).strip()
 
 def _short(s: Optional[str], n: int = 96) -> str:
     if not s: return ""
@@ -58,6 +63,8 @@ async def main():
     ap.add_argument("--no-colors", dest="colors", action="store_false", help="Disable color logs.")
     ap.add_argument("--progress", dest="progress", action="store_true", default=True, help="Show live progress (default).")
     ap.add_argument("--no-progress", dest="progress", action="store_false", help="Hide live progress.")
+    ap.add_argument("--progress-rich", action="store_true", help="Render progress with rich (slower; default is plain ANSI).")
+    ap.add_argument("--flush-every", type=int, default=FLUSH_EVERY, help=f"Write + flush outputs every N rows (default {FLUSH_EVERY}; 1 for live tailing).")
     args = ap.parse_args()
 
     # Resolve range
@@ -73,6 +80,8 @@ async def main():
         args.start = 1
     if args.start < 1 or args.end < args.start:
         raise SystemExit("Invalid range. Ensure start>=1 and end>=start.")
+    if args.flush_every < 1:
+        raise SystemExit("--flush-every must be >= 1.")
 
     # Outputs
     tsv_out = None
@@ -91,10 +100,31 @@ async def main():
         tsv_out.write("\t".join(TSV_HEADERS) + "\n"); tsv_out.flush()
     csv_writer = None
     if csv_out:
-        csv_writer = csv.DictWriter(csv_out, fieldnames=CSV_FIELDS)
-        csv_writer.writeheader(); csv_out.flush()
-
-    console = Console(stderr=True) if (args.colors and args.progress and RICH) else None
+        csv_writer = csv.writer(csv_out)
+        csv_writer.writerow(CSV_FIELDS); csv_out.flush()
+
+    console = Console(stderr=True) if (args.colors and args.progress and args.progress_rich and RICH) else None
+    # Raw bytes go straight to the binary buffer; only touch it on a real tty
+    # (captured or text-only stderr may have no .buffer, or stderr is None)
+    ansi = bool(args.colors and args.progress and console is None
+                and sys.stderr is not None and sys.stderr.isatty()
+                and hasattr(sys.stderr, "buffer"))
+    err = sys.stderr.buffer if ansi else None
+    err_enc = (sys.stderr.encoding or "utf-8") if ansi else "utf-8"
+
+    # Batched sinks: one write() per FLUSH_EVERY rows instead of write+flush per row
+    tsv_buf: list[str] = []
+    csv_buf: list[tuple] = []
+
+    def flush_tsv():
+        if tsv_buf:
+            tsv_out.write("".join(tsv_buf)); tsv_out.flush()
+            tsv_buf.clear()
+
+    def flush_csv():
+        if csv_buf:
+            csv_writer.writerows(csv_buf); csv_out.flush()
+            csv_buf.clear()
 
     def on_progress(idx: int, pnum: int, ids_rec, norm_rec):
         if args.progress:
@@ -116,20 +146,33 @@ async def main():
                 if tail:
                     line.append("  "); line.append(tail, style="dim")
                 console.print(line)
+            elif ansi:
+                status = (norm_rec.get("status") or "").upper()
+                key = "WITHDRAWN" if "WITHDRAWN" in status else ("CLOSED" if "CLOSED" in status else "")
+                line = _ANSI[key] + base.encode(err_enc, "replace") + _RESET
+                if tail:
+                    line += b"  " + _DIM + tail.encode(err_enc, "replace") + _RESET
+                err.write(line + b"\n"); err.flush()
             else:
                 msg = base + (("  " + tail) if tail else "")
                 print(msg, file=sys.stderr, flush=True)
 
         if tsv_out:
-            tsv_row = [ _sanitize_tsv(ids_rec.get(h)) for h in TSV_HEADERS ]
-            tsv_out.write("\t".join(tsv_row) + "\n"); tsv_out.flush()
+            tsv_row = list(map(_sanitize_tsv, _tsv_values(ids_rec)))
+            tsv_buf.append("\t".join(tsv_row) + "\n")
+            if len(tsv_buf) >= args.flush_every:
+                flush_tsv()
         if csv_writer:
-            csv_writer.writerow(norm_rec); csv_out.flush()
+            csv_buf.append(_csv_values(norm_rec))
+            if len(csv_buf) >= args.flush_every:
+                flush_csv()
 
     scraper = AllItemsScraper(headless=args.headless, block_resources=True)
     try:
         await scraper.scrape_pages(args.start, args.end, progress_cb=on_progress)
     finally:
+        if tsv_out: flush_tsv()
+        if csv_writer: flush_csv()
         for f in to_close:
             f.close()
         await scraper.stop()
@@ -1,8 +1,8 @@
 # scraper_engine.py
 import asyncio
+import json
 import re
 from typing import Any, Callable, Dict, List, Optional, Tuple
-from urllib.parse import urljoin, urldefrag
 
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page, TimeoutError as PWTimeout
 
@@ -22,16 +22,197 @@ NEXT_PAGE_CANDIDATES = [
     ".pagination .next a, .pagination-next a, a.pagination-next",
 ]
 
-DOLLAR_RE = re.compile(r"\$\s?[\d,]+(?:\.\d{2})?")
-BIDS_RE = re.compile(r"\(bids:\s*([0-9]+)\)", re.I)
+# Keeps a live item-anchor count in the page: a MutationObserver marks it dirty
+# and the DOM is only re-queried when someone reads __anchorCount() after a
+# change, so polling during autoscroll is a cheap call returning an int.
+_ANCHOR_COUNT_JS_SRC = """
+(() => {
+  const sel = %s;
+  let n = 0, dirty = true;
+  new MutationObserver(() => { dirty = true; }).observe(document, { childList: true, subtree: true });
+  window.__anchorCount = () => {
+    if (dirty) { n = document.querySelectorAll(sel).length; dirty = false; }
+    return n;
+  };
+})();
+""" % json.dumps(ITEM_ANCHOR_SELECTOR)
+
+# Images, media, fonts and stylesheets aren't needed for extraction
+BLOCKED_URL_RE = re.compile(
+    r"\.(?:png|jpe?g|gif|webp|avif|svg|ico|bmp|woff2?|ttf|otf|eot|css|mp4|webm|ogg|mp3|wav)(?:[?#]|$)",
+    re.I,
+)
+
+# IDS-style record keys, in TSV column order
+IDS_FIELDS = (
+    "pic href", "pic src", "trunc-title",
+    "float-left", "float-right",
+    "float-left 2", "float-right 2", "float-right 3", "float-left 4",
+    "item_extra_info", "float-right 5", "red_small",
+    "float-left 5", "float-left 6", "float-right 6", "float-left 7",
+)
+
+# Normalized record keys, in CSV column order; read rows by key (as cli.py's
+# _csv_values does) rather than relying on the record's key order
+NORM_FIELDS = (
+    "item_url", "image_url", "title",
+    "current_bid", "min_bid", "bid_increment",
+    "high_bidder", "bids",
+    "time_remaining", "item_location",
+    "status", "extra_info",
+)
+
+# Installed once per context with add_init_script(), so each extraction only
+# sends a short call over CDP instead of re-sending (and re-parsing) this source.
+# Extraction and normalization are fused: for every card the page returns the
+# IDS-style record (keyed by IDS_FIELDS) and the normalized record directly,
+# so Python does no per-item string work.
+_EXTRACT_JS_SRC = """
+(() => {
+  const pickText = (el) => (el && el.innerText ? el.innerText.trim() : null);
+  const absUrl = (v) => {
+    if (!v) return null;
+    try { return new URL(v, location.href).href; } catch (e) { return v; }
+  };
+  const normSpace = (s) => (typeof s === "string" ? s.replace(/\\s+/g, " ").trim() : s);
+  const cardSel = "[class*='card'],[class*='item'],[class*='list'],[class*='row'],[class*='column']";
+
+  // float-left label -> normalized field; exact keys hit the map directly,
+  // anything decorated falls back to the first substring match
+  const LABEL_MAP = {
+    "current bid": "current_bid",
+    "min bid": "min_bid",
+    "high bidder": "high_bidder",
+    "time remaining": "time_remaining",
+    "item location": "item_location",
+  };
+  const LABEL_KEYS = Object.keys(LABEL_MAP);
+  const labelField = (low) => {
+    const f = LABEL_MAP[low];
+    if (f !== undefined) return f;
+    const key = LABEL_KEYS.find((k) => low.includes(k));
+    return key === undefined ? null : LABEL_MAP[key];
+  };
+  const BIDS_RE = /\\(bids:\\s*([0-9]+)\\)/i;
+  const DOLLAR_RE = /\\$\\s?[\\d,]+(?:\\.\\d{2})?/g;
+  const WITHDRAWN_RE = /WITHDRAWN/i;
+  const CLOSED_RE = /CLOSED/i;
+  // WITHDRAWN anywhere wins over CLOSED; the case-insensitive test avoids
+  // upper-casing the card text
+  const findStatus = (srcs) => (srcs.some((t) => WITHDRAWN_RE.test(t)) ? "WITHDRAWN"
+    : srcs.some((t) => CLOSED_RE.test(t)) ? "CLOSED" : null);
+
+  const normalize = (href, imgSrc, trunc, lefts, rights, extra, red, cardText) => {
+    // Free-text values are whitespace-normalized where they're assigned;
+    // URLs, bids and status can't carry runs of whitespace.
+    const norm = {
+      item_url: href,
+      image_url: imgSrc,
+      title: normSpace(trunc),
+      current_bid: null,
+      min_bid: null,
+      bid_increment: null,
+      high_bidder: null,
+      bids: null,
+      time_remaining: null,
+      item_location: null,
+      status: null,
+      extra_info: normSpace(extra || red),
+    };
+    lefts.forEach((lbl, i) => {
+      if (!lbl) return;
+      const low = lbl.trim().replace(/:+$/, "").toLowerCase();
+      const field = labelField(low);
+      if (field) norm[field] = normSpace(rights[i] ?? null);
+    });
+
+    const m = BIDS_RE.exec(cardText || "");
+    if (m) norm.bids = m[1];
 
-def _norm_space(s: Optional[str]) -> Optional[str]:
-    if s is None:
-        return None
-    return " ".join(s.split())
+    const sources = [extra || "", red || "", cardText || "", trunc || ""];
+    norm.status = findStatus(sources);
 
-def _pick(arr: List[Optional[str]], idx: int) -> Optional[str]:
-    return arr[idx] if idx < len(arr) else None
+    // First dollar amount in reading order that isn't already a known bid
+    const known = [norm.current_bid, norm.min_bid];
+    outer: for (const src of sources) {
+      for (const d of src.match(DOLLAR_RE) || []) {
+        if (!known.includes(d)) { norm.bid_increment = normSpace(d); break outer; }
+      }
+    }
+
+    if (norm.item_location && norm.item_location.toUpperCase().includes("WITHDRAWN")) {
+      norm.status = "WITHDRAWN";
+    }
+    return norm;
+  };
+
+  // One selector pass per card root, bucketed by class, instead of five
+  // separate querySelector(All) calls per anchor
+  const PARTS_SEL = ".float-left, .float-right, .trunc-title, .item_extra_info, .red_small";
+  const collectParts = (root) => {
+    const parts = { lefts: [], rights: [], trunc: null, extra: null, red: null };
+    for (const el of root.querySelectorAll(PARTS_SEL)) {
+      const cl = el.classList;
+      if (cl.contains("float-left")) parts.lefts.push(pickText(el));
+      if (cl.contains("float-right")) parts.rights.push(pickText(el));
+      if (!parts.trunc && cl.contains("trunc-title")) parts.trunc = el;
+      if (!parts.extra && cl.contains("item_extra_info")) parts.extra = el;
+      if (!parts.red && cl.contains("red_small")) parts.red = el;
+    }
+    return parts;
+  };
+
+  // hrefs already handed to Python from this document; "Load more" keeps old
+  // cards in the DOM, so each call only ships the cards added since the last
+  window.__extracted = new Set();
+
+  window.__mvba_extract = () => {
+    const extracted = window.__extracted;
+    const anchors = Array.from(document.querySelectorAll("a[href*='/auction/'][href*='/item/']")).filter(a => a.querySelector('img'));
+    const partsByRoot = new Map();
+    const out = [];
+    for (const a of anchors) {
+      const rawHref = a.getAttribute('href');
+      const href = rawHref ? absUrl(rawHref).split('#')[0] : null;
+      if (!href || extracted.has(href)) continue;
+      extracted.add(href);
+      const img = a.querySelector('img');
+      const imgSrc = absUrl((img && (img.getAttribute('src') || img.getAttribute('data-src'))) || null);
+      const root = a.closest(cardSel) || a;
+      let parts = partsByRoot.get(root);
+      if (!parts) { parts = collectParts(root); partsByRoot.set(root, parts); }
+      const { lefts, rights } = parts;
+      const trunc = (parts.trunc && parts.trunc.innerText.trim()) || a.innerText.trim() || null;
+      const extra = pickText(parts.extra);
+      const red = pickText(parts.red);
+      const L = (i) => lefts[i] ?? null, R = (i) => rights[i] ?? null;
+      out.push({
+        picHref: href,
+        ids: {
+          "pic href": href,
+          "pic src": imgSrc,
+          "trunc-title": trunc,
+          "float-left": L(0),
+          "float-right": R(0),
+          "float-left 2": L(1),
+          "float-right 2": R(1),
+          "float-right 3": R(2),
+          "float-left 4": L(3),
+          "item_extra_info": extra,
+          "float-right 5": R(4),
+          "red_small": red,
+          "float-left 5": L(4),
+          "float-left 6": L(5),
+          "float-right 6": R(5),
+          "float-left 7": L(6),
+        },
+        norm: normalize(href, imgSrc, trunc, lefts, rights, extra, red, pickText(root)),
+      });
+    }
+    return out;
+  };
+})();
+"""
 
 class AllItemsScraper:
     """Async scraper reusing a single Chromium instance."""
@@ -56,17 +237,27 @@ class AllItemsScraper:
 
         self._pw = None
         self._browser: Optional[Browser] = None
+        # One context for the scraper's lifetime; each scrape only opens a Page
+        self._ctx: Optional[BrowserContext] = None
         self._lock = asyncio.Lock()
 
     async def start(self) -> None:
         async with self._lock:
-            if self._browser is not None:
+            if self._ctx is not None:
                 return
-            self._pw = await async_playwright().start()
-            self._browser = await self._pw.chromium.launch(headless=self.headless)
+            # Each step is skipped if an earlier start() got that far, so a
+            # failed context setup is retried rather than leaving _ctx unset
+            if self._pw is None:
+                self._pw = await async_playwright().start()
+            if self._browser is None:
+                self._browser = await self._pw.chromium.launch(headless=self.headless)
+            self._ctx = await self._new_context()
 
     async def stop(self) -> None:
         async with self._lock:
+            if self._ctx is not None:
+                await self._ctx.close()
+                self._ctx = None
             if self._browser is not None:
                 await self._browser.close()
                 self._browser = None
@@ -86,30 +277,45 @@ class AllItemsScraper:
         # IMPORTANT: these are synchronous in Playwright's Python API
         ctx.set_default_timeout(self.default_timeout_ms)
         ctx.set_default_navigation_timeout(self.default_timeout_ms)
+        await ctx.add_init_script(script=_EXTRACT_JS_SRC)
+        await ctx.add_init_script(script=_ANCHOR_COUNT_JS_SRC)
 
         if self.block_resources:
-            async def _route(route, request):
-                rtype = request.resource_type
-                if rtype in ("image", "media", "font", "stylesheet"):
-                    await route.abort()
-                else:
-                    await route.continue_()
-            await ctx.route("**/*", _route)
+            # Match on the URL so only requests we drop ever reach Python;
+            # everything else goes straight through without a route round-trip.
+            async def _abort(route):
+                await route.abort()
+            await ctx.route(BLOCKED_URL_RE, _abort)
 
         return ctx
 
+    async def _anchor_count(self, page: Page) -> int:
+        return await page.evaluate("window.__anchorCount()")
+
     async def _autoscroll_until_stall(self, page: Page, scroll_pause_s: float = 0.6, max_rounds_no_new: int = 2) -> Tuple[int, int]:
-        last_cnt = await page.locator(ITEM_ANCHOR_SELECTOR).count()
+        # scroll_pause_s is the longest we wait for new anchors after a scroll;
+        # growth ends the wait as soon as the DOM reports it.
+        timeout_ms = int(scroll_pause_s * 1000)
+        last_cnt = await self._anchor_count(page)
         rounds = 0
         total_scrolls = 0
         while rounds < max_rounds_no_new:
             try:
-                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                await page.evaluate(
+                    "window.__lastCount = window.__anchorCount(); window.scrollTo(0, document.body.scrollHeight)"
+                )
             except Exception:
                 break
-            await page.wait_for_timeout(int(scroll_pause_s * 1000))
             total_scrolls += 1
-            new_cnt = await page.locator(ITEM_ANCHOR_SELECTOR).count()
+            try:
+                await page.wait_for_function(
+                    "() => window.__anchorCount() !== window.__lastCount", timeout=timeout_ms
+                )
+            except PWTimeout:
+                pass
+            except Exception:
+                break
+            new_cnt = await self._anchor_count(page)
             if new_cnt <= last_cnt:
                 rounds += 1
             else:
@@ -123,7 +329,8 @@ class AllItemsScraper:
         for sel in selectors:
             try:
                 el = page.locator(sel).first
-                if await el.count() > 0 and await el.is_visible():
+                # is_visible() is False for a missing element, no count() round-trip needed
+                if await el.is_visible():
                     await el.click()
                     return True
             except Exception:
@@ -131,121 +338,7 @@ class AllItemsScraper:
         return False
 
     async def _extract_items_js(self, page: Page) -> List[Dict[str, Any]]:
-        js = """
-(() => {
-  const anchors = Array.from(document.querySelectorAll("a[href*='/auction/'][href*='/item/']")).filter(a => a.querySelector('img'));
-  const pickText = (el) => (el && el.innerText ? el.innerText.trim() : null);
-  const nearestCardRoot = (a) => {
-    let el = a;
-    for (let i = 0; i < 6; i++) {
-      if (!el) break;
-      const cls = el.className || "";
-      if (typeof cls === "string" && (cls.includes("card") || cls.includes("item") || cls.includes("list") || cls.includes("row") || cls.includes("column") || cls.includes("listview"))) {
-        return el;
-      }
-      el = el.parentElement;
-    }
-    return a;
-  };
-  const out = [];
-  for (const a of anchors) {
-    const href = a.getAttribute('href') || null;
-    const img = a.querySelector('img');
-    const imgSrc = (img && (img.getAttribute('src') || img.getAttribute('data-src'))) || null;
-    const root = nearestCardRoot(a);
-    const truncEl = root.querySelector('.trunc-title');
-    const trunc = (truncEl && truncEl.innerText.trim()) || a.innerText.trim() || null;
-    const lefts = []; root.querySelectorAll('.float-left').forEach(n => lefts.push(pickText(n)));
-    const rights = []; root.querySelectorAll('.float-right').forEach(n => rights.push(pickText(n)));
-    const itemExtraEl = root.querySelector('.item_extra_info');
-    const redSmallEl  = root.querySelector('.red_small');
-    out.push({
-      picHref: href,
-      picSrc: imgSrc,
-      truncTitle: trunc,
-      lefts, rights,
-      itemExtraInfo: pickText(itemExtraEl),
-      redSmall: pickText(redSmallEl),
-      cardText: pickText(root)
-    });
-  }
-  return out;
-})();
-        """
-        items = await page.evaluate(js)
-        for it in items:
-            if it.get("picHref"):
-                absu = urljoin(ALLITEMS_URL, it["picHref"])
-                it["picHref"], _ = urldefrag(absu)
-            if it.get("picSrc"):
-                it["picSrc"] = urljoin(ALLITEMS_URL, it["picSrc"])
-        return items
-
-    def _normalize_record(self, it: Dict[str, Any]) -> Dict[str, Optional[str]]:
-        lefts: List[Optional[str]] = it.get("lefts") or []
-        rights: List[Optional[str]] = it.get("rights") or []
-        def pair(i: int) -> Tuple[Optional[str], Optional[str]]:
-            return _pick(lefts, i), _pick(rights, i)
-
-        pairs: List[Tuple[str, Optional[str]]] = []
-        for i, lbl in enumerate(lefts):
-            if not lbl: continue
-            val = rights[i] if i < len(rights) else None
-            pairs.append((lbl.strip().rstrip(":"), _norm_space(val)))
-
-        norm: Dict[str, Optional[str]] = {
-            "item_url": it.get("picHref"),
-            "image_url": it.get("picSrc"),
-            "title": _norm_space(it.get("truncTitle")),
-            "current_bid": None,
-            "min_bid": None,
-            "bid_increment": None,
-            "high_bidder": None,
-            "bids": None,
-            "time_remaining": None,
-            "item_location": None,
-            "status": None,
-            "extra_info": _norm_space(it.get("itemExtraInfo") or it.get("redSmall")),
-        }
-
-        for label, value in pairs:
-            low = label.lower()
-            if "current bid" in low:   norm["current_bid"] = value
-            elif "min bid" in low:     norm["min_bid"] = value
-            elif "high bidder" in low: norm["high_bidder"] = value
-            elif "time remaining" in low: norm["time_remaining"] = value
-            elif "item location" in low:  norm["item_location"] = value
-
-        card_text = it.get("cardText") or ""
-        m = BIDS_RE.search(card_text)
-        if m:
-            norm["bids"] = m.group(1)
-
-        text_all = " ".join([
-            it.get("itemExtraInfo") or "",
-            it.get("redSmall") or "",
-            card_text,
-            it.get("truncTitle") or "",
-        ]).upper()
-        if "WITHDRAWN" in text_all:
-            norm["status"] = "WITHDRAWN"
-        elif "CLOSED" in text_all:
-            norm["status"] = "CLOSED"
-
-        dollars = DOLLAR_RE.findall(text_all)
-        if dollars:
-            uniq = []
-            for d in dollars:
-                if d not in uniq: uniq.append(d)
-            known = {norm.get("current_bid"), norm.get("min_bid")}
-            unknown = [d for d in uniq if d not in known and d]
-            if unknown:
-                norm["bid_increment"] = unknown[0]
-
-        if norm.get("item_location") and "WITHDRAWN" in norm["item_location"].upper():
-            norm["status"] = "WITHDRAWN"
-
-        return {k: (_norm_space(v) if isinstance(v, str) else v) for k, v in norm.items()}
+        return await page.evaluate("window.__mvba_extract()")
 
     async def scrape_pages(
         self,
@@ -257,114 +350,115 @@ class AllItemsScraper:
             raise ValueError("Invalid range: start must be >=1 and end >= start")
 
         await self.start()
-        ctx = await self._new_context()
-        page = await ctx.new_page()
-        await page.goto(ALLITEMS_URL, wait_until="domcontentloaded")
+        page = await self._ctx.new_page()
+
+        # Items reach progress_cb through a bounded queue drained by its own
+        # task, so a slow sink (file writes, console output) runs while the
+        # browser is busy loading the next page rather than in between.
+        sink_q: asyncio.Queue = asyncio.Queue(maxsize=512)
+
+        async def _drain() -> None:
+            while True:
+                item = await sink_q.get()
+                if item is None:
+                    return
+                try:
+                    progress_cb(*item)
+                except Exception:
+                    pass
+
+        drain_task = asyncio.create_task(_drain()) if progress_cb else None
         try:
-            await page.wait_for_selector(ITEM_ANCHOR_SELECTOR, timeout=20_000)
-        except PWTimeout:
-            pass
-
-        await self._autoscroll_until_stall(page, 0.6, 2)
-
-        seen: set[str] = set()
-        current_page = 1
-        idx = 1
-
-        ids_items: List[Dict[str, Any]] = []
-        norm_items: List[Dict[str, Any]] = []
-
-        async def collect(pnum: int):
-            nonlocal idx
-            items = await self._extract_items_js(page)
-            # de-duplicate across pages regardless of start
-            new_items = []
-            for it in items:
-                href = it.get("picHref")
-                if not href or href in seen:
-                    continue
-                seen.add(href)
-                new_items.append(it)
-
-            # Only record/output if pnum is within requested range
-            if pnum < start:
-                return
+            await page.goto(ALLITEMS_URL, wait_until="domcontentloaded")
+            try:
+                await page.wait_for_selector(ITEM_ANCHOR_SELECTOR, timeout=20_000)
+            except PWTimeout:
+                pass
+
+            await self._autoscroll_until_stall(page, 0.6, 2)
+
+            seen: set[str] = set()
+            current_page = 1
+            idx = 1
+
+            ids_items: List[Dict[str, Any]] = []
+            norm_items: List[Dict[str, Any]] = []
+
+            async def collect(pnum: int):
+                nonlocal idx
+                items = await self._extract_items_js(page)
+                # The page only returns cards it hasn't returned before; this
+                # still de-duplicates across navigations (fresh document, fresh
+                # in-page set) regardless of start
+                new_items = []
+                for it in items:
+                    href = it.get("picHref")
+                    if not href or href in seen:
+                        continue
+                    seen.add(href)
+                    new_items.append(it)
+
+                # Only record/output if pnum is within requested range
+                if pnum < start:
+                    return
+
+                for it in new_items:
+                    ids_rec = it["ids"]
+                    norm = it["norm"]
+
+                    ids_items.append(ids_rec)
+                    norm_items.append(norm)
+
+                    if drain_task:
+                        await sink_q.put((idx, pnum, ids_rec, norm))
+                    idx += 1
+
+            # Page 1
+            await collect(current_page)
+
+            # Next pages up to 'end'
+            while current_page < end:
+                progressed = False
+
+                if await self._try_click_any(page, LOAD_MORE_CANDIDATES):
+                    await page.wait_for_timeout(700)
+                    await self._autoscroll_until_stall(page, 0.6, 2)
+                    current_page += 1
+                    await collect(current_page)
+                    progressed = True
 
-            for it in new_items:
-                lefts = it.get("lefts") or []
-                rights = it.get("rights") or []
-                ids_rec = {
-                    "pic href": it.get("picHref"),
-                    "pic src": it.get("picSrc"),
-                    "trunc-title": it.get("truncTitle"),
-                    "float-left": _pick(lefts, 0),
-                    "float-right": _pick(rights, 0),
-                    "float-left 2": _pick(lefts, 1),
-                    "float-right 2": _pick(rights, 1),
-                    "float-right 3": _pick(rights, 2),
-                    "float-left 4": _pick(lefts, 3),
-                    "item_extra_info": it.get("itemExtraInfo"),
-                    "float-right 5": _pick(rights, 4),
-                    "red_small": it.get("redSmall"),
-                    "float-left 5": _pick(lefts, 4),
-                    "float-left 6": _pick(lefts, 5),
-                    "float-right 6": _pick(rights, 5),
-                    "float-left 7": _pick(lefts, 6),
-                }
-                norm = self._normalize_record(it)
-
-                ids_items.append(ids_rec)
-                norm_items.append(norm)
-
-                if progress_cb:
+                if not progressed and await self._try_click_any(page, NEXT_PAGE_CANDIDATES):
                     try:
-                        progress_cb(idx, pnum, ids_rec, norm)
-                    except Exception:
+                        await page.wait_for_load_state("domcontentloaded", timeout=20_000)
+                    except PWTimeout:
                         pass
-                idx += 1
-
-        # Page 1
-        await collect(current_page)
-
-        # Next pages up to 'end'
-        while current_page < end:
-            progressed = False
-
-            if await self._try_click_any(page, LOAD_MORE_CANDIDATES):
-                await page.wait_for_timeout(700)
-                await self._autoscroll_until_stall(page, 0.6, 2)
-                current_page += 1
-                await collect(current_page)
-                progressed = True
-
-            if not progressed and await self._try_click_any(page, NEXT_PAGE_CANDIDATES):
-                try:
-                    await page.wait_for_load_state("domcontentloaded", timeout=20_000)
-                except PWTimeout:
-                    pass
-                await self._autoscroll_until_stall(page, 0.6, 2)
-                current_page += 1
-                await collect(current_page)
-                progressed = True
-
-            if not progressed:
-                before = await page.locator(ITEM_ANCHOR_SELECTOR).count()
-                await self._autoscroll_until_stall(page, 0.6, 2)
-                after = await page.locator(ITEM_ANCHOR_SELECTOR).count()
-                if after > before:
+                    await self._autoscroll_until_stall(page, 0.6, 2)
                     current_page += 1
                     await collect(current_page)
                     progressed = True
 
-            if not progressed:
-                break
-
-        await ctx.close()
-        return {
-            "source_url": ALLITEMS_URL,
-            "start": start,
-            "end": end,
-            "items_count": len(ids_items),
-            "ids": ids_items,
-            "normalized": norm_items,
-        }
+                if not progressed:
+                    before = await self._anchor_count(page)
+                    await self._autoscroll_until_stall(page, 0.6, 2)
+                    after = await self._anchor_count(page)
+                    if after > before:
+                        current_page += 1
+                        await collect(current_page)
+                        progressed = True
+
+                if not progressed:
+                    break
+
+            return {
+                "source_url": ALLITEMS_URL,
+                "start": start,
+                "end": end,
+                "items_count": len(ids_items),
+                "ids": ids_items,
+                "normalized": norm_items,
+            }
+        finally:
+            if drain_task:
+                await sink_q.put(None)
+                await drain_task
+            await page.close()